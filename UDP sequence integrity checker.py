@@ -1,13 +1,24 @@
 import os
+import sys
+import numpy as np
 import pandas as pd
 
-# Function to extract sequence number from Data column
-def extract_sequence_number(hex_data):
-    try:
-        extracted_hex = hex_data[20:28]  # Skip first 20 characters, take next 8
-        return int(extracted_hex, 16)  # Convert hex to decimal
-    except:
-        return None
+# Arrow-backed strings run the .str operations in Arrow's C++ kernels; plain strings are the fallback
+try:
+    import pyarrow
+    string_dtype = "string[pyarrow]"
+except ImportError:
+    string_dtype = str
+
+# Function to extract sequence numbers from the Data column (invalid rows become NaN)
+def extract_sequence_numbers(data):
+    extracted_hex = data.str.slice(20, 28)  # Skip first 20 characters, take next 8
+    valid = extracted_hex.str.fullmatch(r"[0-9a-fA-F]{8}", na=False).to_numpy(dtype=bool)
+    sequence_numbers = np.full(len(data), np.nan)
+    if valid.any():
+        # Convert all valid hex slices at once as big-endian uint32
+        sequence_numbers[valid] = np.frombuffer(bytes.fromhex("".join(extracted_hex[valid].tolist())), dtype=">u4")
+    return pd.Series(sequence_numbers, index=data.index)
 
 # Get all CSV files in the script's directory
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -32,7 +43,7 @@ selected_file = csv_files[file_index]
 print(f"\nProcessing: {selected_file}\n")
 
 # Read the CSV file
-df = pd.read_csv(os.path.join(script_dir, selected_file))
+df = pd.read_csv(os.path.join(script_dir, selected_file), dtype={'Destination': 'category', 'Protocol': string_dtype, 'Data': string_dtype})
 
 # Ensure required columns exist
 if 'Destination' not in df.columns or 'Data' not in df.columns or 'Protocol' not in df.columns:
@@ -40,36 +51,40 @@ if 'Destination' not in df.columns or 'Data' not in df.columns or 'Protocol' not
     exit()
 
 # Filter rows where Destination is in the 239.x.x.x range and Protocol is UDP
-df = df[(df['Destination'].astype(str).str.startswith('239.')) & (df['Protocol'] == 'UDP')]
+# (the prefix is tested once per distinct destination, then rows are matched by category code)
+destinations = df['Destination'].cat
+is_multicast = np.isin(destinations.codes, np.flatnonzero(destinations.categories.str.startswith('239.')))
+df = df[is_multicast & (df['Protocol'] == 'UDP').fillna(False)]
 
 # Remove malformed packets (length <= 65)
 df = df[df['Length'] > 65]
 
 # Extract sequence numbers
-df['Sequence Number'] = df['Data'].astype(str).apply(extract_sequence_number)
+df['Sequence Number'] = extract_sequence_numbers(df['Data'])
 
 # Process each multicast group
-grouped = df.groupby('Destination')
+grouped = df.groupby('Destination', observed=True)
 summary = []
 
 for destination, group in grouped:
-    print(f"Multicast Group: {destination}")
-    sequence_numbers = group['Sequence Number'].dropna().astype(int).tolist()
-    packet_numbers = group['No.'].tolist()
+    # Collect this group's report and write it once instead of one print call per line
+    messages = [f"Multicast Group: {destination}"]
+    group = group.dropna(subset=['Sequence Number'])  # Keep packet numbers aligned with valid sequence numbers
+    sequence_numbers = group['Sequence Number'].to_numpy(dtype=np.int64)
+    packet_numbers = group['No.'].to_numpy()
     
-    out_of_order = False
-    for i in range(1, len(sequence_numbers)):
-        expected_seq = sequence_numbers[i - 1] + 1
-        actual_seq = sequence_numbers[i]
-        if expected_seq != actual_seq:
-            missed_packets = actual_seq - expected_seq
-            print(f"\u274C No. {packet_numbers[i]}: Expected {expected_seq}, got {actual_seq} ({missed_packets} packets missed)")
-            summary.append([destination, len(sequence_numbers), "\u274C Out-of-order detected", f"Expected {expected_seq}, got {actual_seq}, No. {packet_numbers[i]}"])
-            out_of_order = True
+    # Indices where the next sequence number is not exactly the previous + 1
+    gaps = np.flatnonzero(np.diff(sequence_numbers) != 1)
+    for packet_no, expected_seq, actual_seq in zip(packet_numbers[gaps + 1].tolist(), (sequence_numbers[gaps] + 1).tolist(), sequence_numbers[gaps + 1].tolist()):
+        missed_packets = actual_seq - expected_seq
+        messages.append(f"\u274C No. {packet_no}: Expected {expected_seq}, got {actual_seq} ({missed_packets} packets missed)")
+        summary.append([destination, len(sequence_numbers), "\u274C Out-of-order detected", f"Expected {expected_seq}, got {actual_seq}, No. {packet_no}"])
     
-    if not out_of_order:
-        print(f"\u2705 All sequence numbers are in order!")
+    if gaps.size == 0:
+        messages.append(f"\u2705 All sequence numbers are in order!")
         summary.append([destination, len(sequence_numbers), "\u2705 All in order", "-"])
+    
+    sys.stdout.write("\n".join(messages) + "\n")
 
 print("\nExporting processed Data ...")
 
@@ -1,8 +1,41 @@
+import argparse
+import array
+import csv
 import os
+import socket
 import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-from datetime import datetime
-import pytz  # For timezone conversion
+from pandas.api.types import union_categoricals
+
+try:
+    import dpkt  # Native pcap parsing without spawning tshark
+except ImportError:
+    dpkt = None
+
+try:
+    from numba import njit  # Optional JIT for the gap-detection kernel
+except ImportError:
+    njit = None
+
+try:
+    import pyarrow  # Arrow-backed strings keep tshark's payload hex out of per-cell Python objects
+    string_dtype = "string[pyarrow]"
+except ImportError:
+    string_dtype = str
+
+try:
+    import xlsxwriter  # Optional streaming Excel writer
+except ImportError:
+    xlsxwriter = None
+
+# Excel number format for the Time column (local time with milliseconds)
+DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss.000"
+
+# Columns exported to the "Processed Data" sheet; the raw Data hex is left out since it dominates file size
+PROCESSED_COLUMNS = ["No.", "Time", "Source", "Destination", "Length", "Sequence Number"]
 
 def list_pcap_files():
     """Scans the current directory and lists available .pcap files."""
@@ -20,38 +53,154 @@ def select_pcap_files(pcap_files):
         print(f"{idx}. {file}")
 
     selected_files = input("\nEnter file numbers to process (comma-separated): ").strip()
-    try:
-        selected_indices = [int(idx) - 1 for idx in selected_files.split(",") if idx.isdigit()]
-        selected_pcap_files = [pcap_files[idx] for idx in selected_indices if 0 <= idx < len(pcap_files)]
-    except ValueError:
-        print("❌ Invalid input! Please enter valid numbers.")
-        return []
+    # One pass over the tokens; anything that is not an in-range file number is skipped
+    selected_pcap_files = []
+    for token in selected_files.split(","):
+        token = token.strip()
+        if token.isdecimal() and 0 < int(token) <= len(pcap_files):
+            selected_pcap_files.append(pcap_files[int(token) - 1])
 
     return selected_pcap_files
 
-def hex_to_decimal(hex_value):
-    """Convert a 4-byte hex string to decimal."""
+if njit is not None:
+    @njit(cache=True)
+    def parse_hex8(words):
+        """Parses 8-char ASCII hex fields, each loaded as one little-endian uint64, into uint32 values plus a
+        per-row validity flag, checking and converting all 8 characters at once with SWAR arithmetic."""
+        ones = np.uint64(0x0101010101010101)
+        high_bits = ones * np.uint64(0x80)
+        low_nibbles = ones * np.uint64(0x0F)
+        values = np.zeros(len(words), dtype=np.uint32)
+        valid = np.zeros(len(words), dtype=np.bool_)
+        for i in range(len(words)):
+            x = words[i]
+            if x & high_bits:
+                continue  # Not ASCII
+            # Adding 0x80 - k sets a byte's high bit exactly when that byte is >= k (bytes are < 0x80, so no carries)
+            is_digit = (x + ones * np.uint64(0x80 - 0x30)) & ~(x + ones * np.uint64(0x80 - 0x3A)) & high_bits
+            lowered = x | ones * np.uint64(0x20)
+            is_letter = (lowered + ones * np.uint64(0x80 - 0x61)) & ~(lowered + ones * np.uint64(0x80 - 0x67)) & high_bits
+            if (is_digit | is_letter) != high_bits:
+                continue
+            # Letters have low nibble 1..6, so adding 9 gives 10..15; then fold nibble pairs, byte pairs and halves,
+            # the first character (lowest byte) ending up most significant
+            nibbles = (x & low_nibbles) + (is_letter >> np.uint64(7)) * np.uint64(9)
+            x = ((nibbles & np.uint64(0x000F000F000F000F)) << np.uint64(4)) | ((nibbles >> np.uint64(8)) & np.uint64(0x000F000F000F000F))
+            x = ((x & np.uint64(0x000000FF000000FF)) << np.uint64(8)) | ((x >> np.uint64(16)) & np.uint64(0x000000FF000000FF))
+            x = ((x & np.uint64(0xFFFF)) << np.uint64(16)) | ((x >> np.uint64(32)) & np.uint64(0xFFFF))
+            values[i] = x
+            valid[i] = True
+        return values, valid
+
+def extract_sequence_numbers(data):
+    """Extract sequence numbers from the Data column in one vectorized pass as (uint32 values, valid-row mask)."""
+    seq_hex = data.str.slice(20, 28)  # Extract 4 bytes after skipping first 10 bytes
+    if njit is not None:
+        # Fixed-width bytes give one 8-byte word per row (short or missing slices are NUL-padded and fail
+        # validation), which the JIT kernel validates and decodes in a single pass
+        words = seq_hex.fillna("").to_numpy(dtype="S8").view("<u8").astype(np.uint64, copy=False)
+        return parse_hex8(words)
+
+    values = np.zeros(len(data), dtype=np.uint32)
+    valid = seq_hex.str.fullmatch(r"[0-9a-fA-F]{8}", na=False).to_numpy(dtype=bool)
+    if valid.any():
+        # Decode every valid 8-char hex slice as one big-endian uint32 buffer
+        packed = bytes.fromhex("".join(seq_hex[valid].tolist()))
+        values[valid] = np.frombuffer(packed, dtype=">u4")
+    return values, valid
+
+def ipv4_categorical(packed_addresses):
+    """Converts a buffer of packed IPv4 addresses to uint32 in one pass and formats each distinct address only once."""
+    ip_numbers = np.frombuffer(packed_addresses, dtype=">u4").astype(np.uint32)
+    codes, unique_ips = pd.factorize(ip_numbers)
+    names = [socket.inet_ntoa(int(ip).to_bytes(4, "big")) for ip in unique_ips]
+    return pd.Categorical.from_codes(codes, names).reorder_categories(sorted(names))
+
+def read_pcap_native(pcap_file):
+    """Decodes Ethernet/IPv4/UDP headers with dpkt and returns the candidate packets as a DataFrame."""
+    # Typed buffers instead of lists of Python objects; each becomes a numpy column without a conversion pass
+    frame_nos, times, lengths = array.array("I"), array.array("d"), array.array("i")
+    sources, destinations = bytearray(), bytearray()  # Packed 4-byte addresses, formatted once per distinct IP
+    sequence_bytes = bytearray()  # Raw 4-byte sequence fields, decoded in one pass at the end
+
     try:
-        return int(hex_value, 16)
-    except ValueError:
+        with open(pcap_file, "rb") as f:
+            reader = dpkt.pcap.UniversalReader(f)
+            if reader.datalink() != dpkt.pcap.DLT_EN10MB:
+                print(f"⚠️ {pcap_file} is not an Ethernet capture, falling back to tshark.")
+                return read_pcap_tshark(pcap_file)
+
+            for frame_no, (ts, buf) in enumerate(reader, 1):
+                try:
+                    eth = dpkt.ethernet.Ethernet(buf)
+                except dpkt.UnpackError:
+                    continue
+                ip = eth.data
+                if not isinstance(ip, dpkt.ip.IP):
+                    continue
+
+                # **Filter Destination IP (only keep 239.50.x.x)**
+                if ip.dst[:2] != b"\xef\x32":
+                    continue
+
+                # dpkt only exposes the captured bytes; when the snaplen cut a packet short, len(buf) is not the
+                # wire length (tshark's frame.len) the malformed check and Length column need, so tshark reads the file
+                if len(ip) < ip.len:
+                    print(f"⚠️ {pcap_file} has packets truncated by the capture snaplen, falling back to tshark.")
+                    return read_pcap_tshark(pcap_file)
+
+                # dpkt does not reassemble IP fragments, while tshark reports each reassembled datagram under its
+                # last fragment's frame.number and frame.len, so fragmented captures are read by tshark as well
+                if ip.mf or ip.offset:
+                    print(f"⚠️ {pcap_file} has fragmented IP packets, falling back to tshark.")
+                    return read_pcap_tshark(pcap_file)
+                if not isinstance(ip.data, dpkt.udp.UDP):
+                    continue
+
+                # **Remove malformed packets (deformed filtering)**
+                payload = ip.data.data
+                if payload[:2] == b"\x31\x00" and len(buf) <= 65:
+                    continue
+
+                # Sequence number is the 4 bytes after skipping the first 10 bytes of payload
+                if len(payload) < 14:
+                    continue
+
+                frame_nos.append(frame_no)
+                times.append(ts)
+                sources += ip.src
+                destinations += ip.dst
+                lengths.append(len(buf))  # Whole packet was captured (checked above), so this is the frame length
+                sequence_bytes += payload[10:14]
+    except (OSError, ValueError, dpkt.NeedData) as e:
+        print(f"❌ Error reading {pcap_file}: {e}")
         return None
 
-def extract_sequence_number(hex_data):
-    """Extract sequence number from Data column."""
-    if isinstance(hex_data, str) and len(hex_data) >= 28:
-        seq_hex = hex_data[20:28]  # Extract 4 bytes after skipping first 10 bytes
-        return hex_to_decimal(seq_hex)
-    return None
+    if not frame_nos:
+        print(f"⚠️ No UDP packets extracted from {pcap_file}.")
+        return None
 
-def extract_pcap_data(pcap_file):
-    """Extracts only UDP packets and returns a DataFrame."""
+    return pd.DataFrame({
+        "No.": np.asarray(frame_nos),
+        "Time": np.asarray(times),
+        "Source": ipv4_categorical(sources),
+        "Destination": ipv4_categorical(destinations),
+        "Length": np.asarray(lengths),
+        "Sequence Number": np.frombuffer(sequence_bytes, dtype=">u4").astype(np.int64),
+    })
+
+def read_pcap_tshark(pcap_file):
+    """Streams UDP packets out of tshark and returns the candidate packets as a DataFrame."""
     tshark_cmd = [
         "tshark", 
         "-r", pcap_file, 
-        "-Y", "udp",  # Filter only UDP packets
+        "-n",  # No name resolution, so tshark skips loading its resolver databases at startup
+        # Only UDP packets sent to 239.50.x.x, minus malformed packets (payload starting 31:00 and length <= 65)
+        "-Y", "udp && ip.dst == 239.50.0.0/16 && !(frame.len <= 65 && data.data[0:2] == 31:00)",
         "-T", "fields",
-        "-E", "separator=,", 
+        "-E", "separator=/t",  # Tab never occurs inside these fields, so no quoting is needed
         "-E", "header=y",
+        "-E", "occurrence=f",  # One value per field so every row has the same column count
         "-e", "frame.number",
         "-e", "frame.time_epoch",
         "-e", "ip.src",
@@ -59,63 +208,84 @@ def extract_pcap_data(pcap_file):
         "-e", "frame.len",  # Extract packet length
         "-e", "data.data"
     ]
+    chunks = []
     try:
-        result = subprocess.run(tshark_cmd, capture_output=True, text=True, check=True)
-        output_lines = result.stdout.splitlines()
+        # Parse tshark's stdout chunk by chunk so only one chunk of raw rows is held in memory
+        with subprocess.Popen(tshark_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1 << 20) as proc:
+            try:
+                reader = pd.read_csv(
+                    proc.stdout,
+                    sep="\t",
+                    names=["No.", "Time", "Source", "Destination", "Length", "Data"],
+                    header=0,
+                    # Typed columns at load time; categorical IPs store each address once and compare as ints
+                    dtype={"No.": "uint32", "Time": "float64", "Source": "category", "Destination": "category", "Length": "int32", "Data": string_dtype},
+                    engine="c",
+                    quoting=csv.QUOTE_NONE,
+                    na_filter=False,  # No NA sentinel scan; an empty Data field stays "" and fails the hex check
+                    chunksize=200_000,
+                )
+                for chunk in reader:
+                    # **Extract Sequence Number** and drop rows without a valid one; the payload hex is
+                    # only needed for this, so it is dropped right away instead of being kept for every packet
+                    sequence_numbers, valid = extract_sequence_numbers(chunk["Data"])
+                    chunk = chunk[valid].drop(columns="Data").assign(**{"Sequence Number": sequence_numbers[valid].astype(np.int64)})
+
+                    chunks.append(chunk)
+            except pd.errors.EmptyDataError:
+                pass  # tshark wrote nothing, not even the header row
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, tshark_cmd)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Error running tshark: {e}")
+        return None
 
-        if output_lines:
-            # Convert to DataFrame and assign column names
-            data = [line.split(",") for line in output_lines if line.strip()]
-            df = pd.DataFrame(data[1:], columns=["No.", "Time", "Source", "Destination", "Length", "Data"])
+    if not chunks:
+        print(f"⚠️ No UDP packets extracted from {pcap_file}.")
+        return None
 
-            # Convert Epoch time to local time format
-            def convert_time(epoch_str):
-                try:
-                    epoch = float(epoch_str)
-                    dt = datetime.fromtimestamp(epoch, pytz.timezone("Asia/Kolkata"))  # Change to local timezone
-                    return dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]  # Retaining milliseconds
-                except ValueError:
-                    return "Invalid Time"
-            
-            df["Time"] = df["Time"].apply(convert_time)
-
-            # Convert Length column to integer
-            df["Length"] = pd.to_numeric(df["Length"], errors="coerce")
-
-            # **Filter Destination IP (only keep 239.50.x.x)**
-            df = df[df["Destination"].str.startswith("239.50.")]
-
-            # **Remove malformed packets (deformed filtering)**
-            df = df[~(df["Data"].str.startswith("3100", na=False) & (df["Length"] <= 65))]
-
-            # **Extract Sequence Number**
-            df["Sequence Number"] = df["Data"].apply(extract_sequence_number)
-
-            # Ensure 'Sequence Number' is fully numeric before sorting
-            df["Sequence Number"] = pd.to_numeric(df["Sequence Number"], errors="coerce")
-            
-            # Drop NaN values (invalid sequence numbers)
-            df = df.dropna(subset=["Sequence Number"])
-            
-            # Convert to integer after ensuring valid numeric values
-            df["Sequence Number"] = df["Sequence Number"].astype(int)
-
-            return df
-        else:
-            print(f"⚠️ No UDP packets extracted from {pcap_file}.")
-            return None
+    df = pd.concat(chunks, ignore_index=True)
 
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error running tshark: {e}")
+    # Chunks carry their own categories, so merge them instead of letting concat fall back to object dtype
+    for column in ("Source", "Destination"):
+        df[column] = union_categoricals([chunk[column] for chunk in chunks], sort_categories=True)
+
+    return df
+
+def extract_pcap_data(pcap_file):
+    """Extracts only UDP packets and returns a DataFrame."""
+    if dpkt is not None:
+        df = read_pcap_native(pcap_file)
+    else:
+        df = read_pcap_tshark(pcap_file)
+    if df is None:
         return None
 
-def process_pcap_files(selected_pcap_files):
+    # Convert Epoch time to local time in one vectorized pass, kept as datetime64 instead of formatted strings
+    # (rounded to microseconds first, like datetime.fromtimestamp, before truncating to milliseconds;
+    # Excel has no time zones, so the local wall-clock time is stored naive and invalid times become NaT)
+    local_time = pd.to_datetime(df["Time"], unit="s", errors="coerce", utc=True).dt.round("us").dt.tz_convert("Asia/Kolkata")
+    df["Time"] = local_time.dt.tz_localize(None).dt.floor("ms")
+
+    return df
+
+def analyze_pcap_file(pcap_file, df, selected_groups, include_processed_sheet):
+    """Analyzes the selected multicast groups of one already extracted PCAP file; runs inside a worker process
+    and returns the file's whole console report."""
+    header = f"\n📊 Analyzing selected groups for {pcap_file}: {', '.join(selected_groups)}\n"
+    output_excel = pcap_file.replace('.pcap', '.xlsx')
+    return header + detect_sequence_gaps(df, selected_groups, output_excel, include_processed_sheet)
+
+def process_pcap_files(selected_pcap_files, include_processed_sheet=True):
     """Processes multiple PCAP files by scanning available multicast groups and allowing user to select."""
     selected_groups_per_pcap = {}
 
-    for pcap_file in selected_pcap_files:
+    # Extract all selected pcaps in parallel, one worker process (and tshark) per file, before asking for groups
+    with ProcessPoolExecutor(max_workers=min(len(selected_pcap_files), os.cpu_count() or 1)) as executor:
+        extracted = list(executor.map(extract_pcap_data, selected_pcap_files))
+
+    for pcap_file, df in zip(selected_pcap_files, extracted):
         print(f"\n📂 Processing: {pcap_file}")
-        df = extract_pcap_data(pcap_file)
         if df is None:
             continue
 
@@ -131,75 +301,153 @@ def process_pcap_files(selected_pcap_files):
             unique_groups[int(idx) - 1] for idx in selected_indices.split(",") 
             if idx.isdigit() and 0 <= int(idx) - 1 < len(unique_groups)
         ]
-        selected_groups_per_pcap[pcap_file] = selected_groups
-
-    # Process all selected PCAP files in one execution
-    for pcap_file, selected_groups in selected_groups_per_pcap.items():
-        df = extract_pcap_data(pcap_file)
-        if df is None:
-            continue
-
-        print(f"\n📊 Analyzing selected groups for {pcap_file}: {', '.join(selected_groups)}")
-        output_excel = pcap_file.replace('.pcap', '.xlsx')
-        detect_sequence_gaps(df, selected_groups, output_excel)
-
-def detect_sequence_gaps(df, selected_groups, output_excel):
-    """Detects sequence number gaps for selected multicast groups and saves summary to Excel."""
+        # Keep the extracted DataFrame next to the selection so the pcap is not parsed a second time
+        selected_groups_per_pcap[pcap_file] = (df, selected_groups)
+
+    if not selected_groups_per_pcap:
+        return
+
+    # Process all selected PCAP files in one execution, one worker process per file
+    with ProcessPoolExecutor(max_workers=min(len(selected_groups_per_pcap), os.cpu_count() or 1)) as executor:
+        # Write each file's whole report in submission order so workers never interleave on the console;
+        # an exception in any worker is raised here
+        dfs, selected_groups = zip(*selected_groups_per_pcap.values())
+        for report in executor.map(analyze_pcap_file, selected_groups_per_pcap.keys(), dfs, selected_groups,
+                                   [include_processed_sheet] * len(selected_groups_per_pcap)):
+            sys.stdout.write(report)
+
+if njit is not None:
+    @njit(cache=True)
+    def find_gaps(sequence_numbers, source_codes):
+        """Returns indices i where packet i + 1 does not continue the sequence of the same source, in a single
+        JIT pass without the intermediate diff and mask arrays."""
+        gaps = np.empty(max(len(sequence_numbers) - 1, 0), dtype=np.int64)
+        count = 0
+        for i in range(len(sequence_numbers) - 1):
+            if source_codes[i + 1] == source_codes[i] and sequence_numbers[i + 1] != sequence_numbers[i] + 1:
+                gaps[count] = i
+                count += 1
+        return gaps[:count]
+else:
+    def find_gaps(sequence_numbers, source_codes):
+        """Returns indices i where packet i + 1 does not continue the sequence of the same source."""
+        same_source = source_codes[1:] == source_codes[:-1]
+        return np.flatnonzero((np.diff(sequence_numbers) != 1) & same_source)
+
+def write_excel(output_excel, sheets):
+    """Writes {sheet name: DataFrame} to Excel, streaming rows in xlsxwriter's constant_memory mode when available."""
+    if xlsxwriter is None:
+        with pd.ExcelWriter(output_excel, datetime_format=DATETIME_FORMAT) as writer:
+            for sheet_name, frame in sheets.items():
+                frame.to_excel(writer, sheet_name=sheet_name, index=False)
+        return
+
+    # pandas emits cells column by column, which constant_memory mode cannot take, so rows are written directly
+    workbook = xlsxwriter.Workbook(output_excel, {
+        "constant_memory": True,
+        "nan_inf_to_errors": True,
+        "strings_to_formulas": False,
+        "strings_to_urls": False,
+        "default_date_format": DATETIME_FORMAT,
+    })
+    header_format = workbook.add_format({"bold": True})
+    try:
+        for sheet_name, frame in sheets.items():
+            if len(frame) >= 1048576:
+                raise ValueError(f"Sheet '{sheet_name}' has {len(frame)} rows, more than Excel's 1048576-row limit.")
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, frame.columns.tolist(), header_format)
+            # NaT cannot be written as a date, so those cells are left blank
+            missing_times = [column for column, dtype in frame.dtypes.items() if dtype.kind == "M" and frame[column].isna().any()]
+            if missing_times:
+                frame = frame.astype({column: object for column in missing_times})
+                frame[missing_times] = frame[missing_times].where(frame[missing_times].notna(), None)
+            for row_idx, row in enumerate(frame.itertuples(index=False, name=None), 1):
+                worksheet.write_row(row_idx, 0, row)
+    finally:
+        workbook.close()
+
+def detect_sequence_gaps(df, selected_groups, output_excel, include_processed_sheet=True):
+    """Detects sequence number gaps for selected multicast groups, saves summary to Excel and returns the console report."""
+    # Both readers already yield integer sequence numbers, so fail loudly instead of re-coercing per group
+    if df["Sequence Number"].dtype.kind not in "iu":
+        raise TypeError(f"'Sequence Number' must be an integer column, got {df['Sequence Number'].dtype}.")
+
+    # Factorize and sort the whole capture once by Destination, Source, Sequence Number as plain numpy
+    # arrays; every group is then one contiguous slice with each source as one run, so no per-group
+    # DataFrame is built (lexsort is stable, so duplicates keep their capture order)
+    destination_codes, destinations = pd.factorize(df["Destination"], sort=True)
+    source_codes, sources = pd.factorize(df["Source"], sort=True)
+    sequence_numbers = df["Sequence Number"].to_numpy(dtype=np.int64)
+    packet_numbers = df["No."].to_numpy()
+    order = np.lexsort((sequence_numbers, source_codes, destination_codes))
+    destination_codes, source_codes = destination_codes[order], source_codes[order]
+    sequence_numbers, packet_numbers = sequence_numbers[order], packet_numbers[order]
     summary = []
+    report = []  # Returned as one string so reports from parallel workers never interleave on the console
 
     for group in selected_groups:
-        print(f"\n🔍 Analyzing Sequence Numbers for Group: {group}")
-        group_df = df[df["Destination"] == group]
+        report.append(f"\n🔍 Analyzing Sequence Numbers for Group: {group}")
+        group_code = destinations.get_indexer([group])[0]
+        group_rows = slice(*np.searchsorted(destination_codes, [group_code, group_code + 1]))
 
-        if group_df.empty:
-            print(f"⚠️ No packets found for {group}. Skipping...")
+        if group_code < 0 or group_rows.start == group_rows.stop:
+            report.append(f"⚠️ No packets found for {group}. Skipping...")
             summary.append([group, 0, "⚠️ No packets found", "-"])
             continue
 
-        grouped = group_df.groupby("Source")
-
-        for source, packets in grouped:
-            print(f"\n🔹 Source: {source}")
-
-            packets["Sequence Number"] = pd.to_numeric(packets["Sequence Number"], errors="coerce")
-            packets = packets.dropna(subset=["Sequence Number"])
-            packets["Sequence Number"] = packets["Sequence Number"].astype(int)
-            packets = packets.sort_values(by="Sequence Number").reset_index(drop=True)
-
-            sequence_numbers = packets["Sequence Number"].tolist()
-            packet_numbers = packets["No."].tolist()
-
-            gaps = []
-            for i in range(1, len(sequence_numbers)):
-                expected_seq = sequence_numbers[i - 1] + 1
-                actual_seq = sequence_numbers[i]
-                if expected_seq != actual_seq:
-                    missed_packets = actual_seq - expected_seq
-                    gaps.append((packet_numbers[i], expected_seq, actual_seq, missed_packets))
-
-            if gaps:
-                for frame_no, expected, actual, missed in gaps:
-                    print(f"❌ No. {frame_no}: Expected {expected}, got {actual} ({missed} packets missed)")
-                    summary.append([group, source, len(sequence_numbers), "❌ Out-of-order detected",
+        group_sources = source_codes[group_rows]
+        group_sequences = sequence_numbers[group_rows]
+        group_packets = packet_numbers[group_rows]
+
+        gaps = find_gaps(group_sequences, group_sources)
+        gap_frames = group_packets[gaps + 1].tolist()
+        expected_seqs = (group_sequences[gaps] + 1).tolist()
+        actual_seqs = group_sequences[gaps + 1].tolist()
+
+        # Run boundaries per source; gaps[gap_ends[i - 1]:gap_ends[i]] belong to the i-th source run
+        starts = np.flatnonzero(np.r_[True, group_sources[1:] != group_sources[:-1]])
+        ends = np.r_[starts[1:], len(group_sources)]
+        gap_ends = np.searchsorted(gaps, ends - 1)
+
+        gap_start = 0
+        for source, start, end, gap_end in zip(sources[group_sources[starts]], starts, ends, gap_ends):
+            report.append(f"\n🔹 Source: {source}")
+            total_packets = int(end - start)
+
+            if gap_start < gap_end:
+                for i in range(gap_start, gap_end):
+                    frame_no, expected, actual = gap_frames[i], expected_seqs[i], actual_seqs[i]
+                    report.append(f"❌ No. {frame_no}: Expected {expected}, got {actual} ({actual - expected} packets missed)")
+                    summary.append([group, source, total_packets, "❌ Out-of-order detected",
                                     f"Expected {expected}, got {actual}, No. {frame_no}"])
             else:
-                print("✅ All sequence numbers are in order!")
-                summary.append([group, source, len(sequence_numbers), "✅ All in order", "-"])
+                report.append("✅ All sequence numbers are in order!")
+                summary.append([group, source, total_packets, "✅ All in order", "-"])
+            gap_start = gap_end
 
-    print("\nExporting processed Data ...")
+    report.append("\nExporting processed Data ...")
 
-    with pd.ExcelWriter(output_excel) as writer:
-        df.to_excel(writer, sheet_name="Processed Data", index=False)
-        pd.DataFrame(summary, columns=["Destination", "Source", "Total Packets", "Status", "Sequence Info"]).to_excel(writer, sheet_name="Summary", index=False)
+    sheets = {}
+    if include_processed_sheet:
+        sheets["Processed Data"] = df[PROCESSED_COLUMNS]
+    sheets["Summary"] = pd.DataFrame(summary, columns=["Destination", "Source", "Total Packets", "Status", "Sequence Info"])
+    write_excel(output_excel, sheets)
 
-    print(f"📂 Processed file saved as: {output_excel}")
+    report.append(f"📂 Processed file saved as: {output_excel}")
+    return "\n".join(report) + "\n"
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Check UDP multicast sequence numbers in PCAP files.")
+    parser.add_argument("--no-processed-sheet", action="store_true",
+                        help="write only the Summary sheet and skip the per-packet Processed Data sheet")
+    args = parser.parse_args()
+
     pcap_files = list_pcap_files()
     selected_pcap_files = select_pcap_files(pcap_files)
     if selected_pcap_files:
-        process_pcap_files(selected_pcap_files)
+        process_pcap_files(selected_pcap_files, include_processed_sheet=not args.no_processed_sheet)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -2,22 +2,29 @@ import pandas as pd
 
 # Load your extracted CSV file
 csv_file = "extracted_data.csv"  # Update this if needed
-df = pd.read_csv(csv_file)
+# Only the "Sequence Number" column is needed for the checks; its dtype is inferred the same way as before
+sequence_numbers = pd.read_csv(csv_file, usecols=["Sequence Number"])["Sequence Number"]
+nan_mask = sequence_numbers.isna()
 
 # ✅ 1. Check for NaN values in the "Sequence Number" column
-nan_count = df["Sequence Number"].isna().sum()
+nan_count = nan_mask.sum()
 print(f"\n🔍 NaN Values in Sequence Number Column: {nan_count}")
 
 # ✅ 2. Check data type of "Sequence Number" column
-sequence_dtype = df["Sequence Number"].dtype
+sequence_dtype = sequence_numbers.dtype
 print(f"\n🔍 Data Type of 'Sequence Number' Column: {sequence_dtype}")
 
 # ✅ 3. Check for Non-Integer Values in "Sequence Number"
-non_integer_rows = df[~df["Sequence Number"].apply(lambda x: isinstance(x, (int, float)))]
-print(f"\n🔍 Non-Integer Values Found: {not non_integer_rows.empty}")
+# (vectorized: a value is flagged when it is present but does not parse as a number)
+non_integer_mask = pd.to_numeric(sequence_numbers, errors="coerce").isna() & ~nan_mask
+print(f"\n🔍 Non-Integer Values Found: {non_integer_mask.any()}")
 
 # ✅ 4. Display any rows where "Sequence Number" is NaN
-nan_rows = df[df["Sequence Number"].isna()]
+# (the full rows are only loaded when there are NaN rows to show; otherwise just the header is read)
+if nan_count:
+    nan_rows = pd.read_csv(csv_file)[nan_mask.to_numpy()]
+else:
+    nan_rows = pd.read_csv(csv_file, nrows=0)
 if not nan_rows.empty:
     print("\n🔍 Rows with NaN Sequence Numbers:")
     print(nan_rows)